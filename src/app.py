@@ -1,18 +1,112 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import http.cookiejar
 import json
 import os
+import re
+from contextlib import asynccontextmanager
 from pathlib import Path
-import ast
-from typing import Any, Dict, List, Optional, Tuple, Union
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 import httpx
-import yaml
 from mcp.server.fastmcp import FastMCP
 
+try:
+    # 可选依赖 orjson（C 实现），未安装时回退到标准库 json
+    import orjson
 
-server = FastMCP("yooztech_mcp_api_request")
+    # orjson 会把超过 64 位的整数静默转为 float，且不接受 NaN/Infinity。
+    # 含 19 位及以上连续数字的输入、以及 orjson 解析失败的输入都交给标准库 json，
+    # 保证解析结果与标准库完全一致（误判只会多走一次标准库，不影响结果）。
+    _LONG_DIGITS_BYTES = re.compile(rb"[0-9]{19}")
+    _LONG_DIGITS_STR = re.compile(r"[0-9]{19}")
+
+    def _json_loads(data: Union[str, bytes]) -> Any:
+        long_digits = _LONG_DIGITS_STR if isinstance(data, str) else _LONG_DIGITS_BYTES
+        if long_digits.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+# PyYAML 仅在读写 YAML 配置时才需要，首次使用时再导入：(yaml 模块, Loader, Dumper)
+_YAML: Optional[Tuple[Any, Any, Any]] = None
+
+
+def _yaml() -> Tuple[Any, Any, Any]:
+    global _YAML
+    if _YAML is None:
+        import yaml
+
+        try:
+            # 优先使用 libyaml 的 C 实现，未编译 libyaml 时回退到纯 Python 实现
+            from yaml import CSafeDumper as dumper, CSafeLoader as loader
+        except ImportError:
+            from yaml import SafeDumper as dumper, SafeLoader as loader
+        _YAML = (yaml, loader, dumper)
+    return _YAML
+
+
+# 进程内共享的 HTTP 客户端，复用连接池与 TLS 会话（仅复用连接，不保留 Cookie：
+# 原先每次调用新建客户端，Cookie 本就不会跨调用保留）
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    # 检查与创建之间没有 await，同一事件循环内不会并发创建，无需加锁
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+            # 原先每次请求新建客户端，Set-Cookie 从不跨请求保留；共享客户端使用不接受任何
+            # Cookie 的 jar，避免会话 Cookie 在不同项目/连接之间泄露。不在响应后清空
+            # client.cookies，因为那会与 api_request_many 的并发请求产生竞争。
+            # 需直接传入 CookieJar：传 httpx.Cookies 会被复制到默认策略的新 jar 中
+            cookies=http.cookiejar.CookieJar(policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])),
+        )
+    return _CLIENT
+
+
+async def _close_client() -> None:
+    global _CLIENT
+    if _CLIENT is not None:
+        client, _CLIENT = _CLIENT, None
+        await client.aclose()
+
+
+# 当前处于运行中的 lowlevel Server.run() 数量。SSE 传输下每个客户端连接都会进入一次
+# lifespan，共享客户端只能在最后一个会话结束时关闭，否则会中断其它会话的请求。
+# 注意：无状态 streamable-HTTP 下每个请求都会单独进入/退出 lifespan，没有并发请求时
+# 客户端会在每次请求后关闭、下次重建，此时连接池无法跨请求复用（stdio/SSE 不受影响）
+_ACTIVE_RUNS = 0
+
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP) -> AsyncIterator[None]:
+    global _ACTIVE_RUNS
+    _ACTIVE_RUNS += 1
+    try:
+        yield
+    finally:
+        _ACTIVE_RUNS -= 1
+        if _ACTIVE_RUNS == 0:
+            await _close_client()
+
+
+server = FastMCP("yooztech_mcp_api_request", lifespan=_lifespan)
 
 
 CONFIG_CANDIDATES: List[str] = [
@@ -20,67 +114,207 @@ CONFIG_CANDIDATES: List[str] = [
     ".mcp_api_request.yaml",
     ".mcp_api_request.json",
 ]
+_CONFIG_RANK: Dict[str, int] = {name: i for i, name in enumerate(CONFIG_CANDIDATES)}
+
+# 上游 AI 可能以字符串形式传入的"空值"
+_NULL_STRS = frozenset({"", "null", "none", "undefined"})
+
+# include_response_headers=false 时仅返回的响应头
+_BRIEF_RESPONSE_HEADERS: Tuple[str, ...] = ("content-type", "content-length", "server")
 
+# 常用 HTTP 方法，复用同一字符串对象
+_METHODS: Dict[str, str] = {m: m for m in ("GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS")}
 
-def _resolve_project_root(project_root: Optional[str]) -> Path:
+# httpx.Timeout 对象按秒数缓存（不可变，可安全复用）
+# 默认超时对象在导入时即创建，且不随缓存清空而淘汰
+_DEFAULT_TIMEOUT_SECONDS = 30.0
+_DEFAULT_TIMEOUT = httpx.Timeout(
+    _DEFAULT_TIMEOUT_SECONDS,
+    connect=_DEFAULT_TIMEOUT_SECONDS,
+    read=_DEFAULT_TIMEOUT_SECONDS,
+    write=_DEFAULT_TIMEOUT_SECONDS,
+)
+_TIMEOUT_CACHE_MAX = 32
+_TIMEOUT_CACHE: Dict[float, httpx.Timeout] = {}
+
+# 配置查找缓存：(project_root 参数, cwd 或空串) -> (项目根目录 mtime_ns, 配置文件路径, 项目根目录)
+_CFG_LOOKUP_MAX = 32
+_CFG_LOOKUP_CACHE: Dict[Tuple[str, str], Tuple[int, Optional[Path], str]] = {}
+
+# 已确认不含配置文件的目录：目录路径 -> 查找时的目录 mtime_ns
+# 目录内新建/删除文件会改变其 mtime，从而使该记录自动失效
+_NEG_DIRS: Dict[str, int] = {}
+
+# 配置解析缓存：路径 -> ((st_dev, st_ino, mtime_ns, size), auth_headers, auth_params)
+# 同时比较 inode，原子替换（rename 覆盖）或 docker cp 后即使 mtime/size 相同也会重新解析
+_TOKENS_CACHE: Dict[str, Tuple[Tuple[int, int, int, int], Dict[str, str], Dict[str, Any]]] = {}
+
+
+def _resolve_project_root(project_root: Optional[str]) -> str:
+    # 纯字符串处理，不解析符号链接，避免 Path.resolve() 的额外开销
     if project_root and isinstance(project_root, str) and project_root.strip():
-        return Path(project_root).expanduser().resolve()
-    return Path(os.getcwd()).resolve()
+        return os.path.abspath(os.path.expanduser(project_root))
+    return os.getcwd()
 
 
-def _choose_write_path(root: Path, fmt: str) -> Path:
+def _choose_write_path(root: str, fmt: str) -> Path:
     fmt_lower = (fmt or "yaml").strip().lower()
     if fmt_lower == "json":
-        return root / ".mcp_api_request.json"
-    return root / ".mcp_api_request.yml"
+        return Path(os.path.join(root, ".mcp_api_request.json"))
+    return Path(os.path.join(root, ".mcp_api_request.yml"))
 
 
-def _find_existing_config(root: Path) -> Optional[Path]:
-    """在指定目录查找配置文件"""
-    for name in CONFIG_CANDIDATES:
-        p = root / name
-        if p.is_file():
-            return p
-    return None
+def _find_existing_config(root: str) -> Optional[Path]:
+    """在指定目录查找配置文件
 
-
-def _smart_find_config(project_root: str) -> Tuple[Optional[Path], Path]:
+    一次 scandir 读取目录项，按 CONFIG_CANDIDATES 的顺序决定优先级。
+    已确认没有配置文件且目录 mtime 未变化时，跳过 scandir 直接返回 None。
+    """
+    best_path: Optional[str] = None
+    best_rank = len(CONFIG_CANDIDATES)
+    try:
+        dir_mtime = os.stat(root).st_mtime_ns
+        if _NEG_DIRS.get(root) == dir_mtime:
+            return None
+        # 遍历过程中目录被删除等情况同样会抛出 OSError
+        with os.scandir(root) as it:
+            for entry in it:
+                rank = _CONFIG_RANK.get(entry.name)
+                if rank is not None and rank < best_rank and entry.is_file():
+                    best_path, best_rank = entry.path, rank
+                    if rank == 0:
+                        break
+    except OSError:
+        return None
+    if best_path is None:
+        _NEG_DIRS[root] = dir_mtime
+        return None
+    _NEG_DIRS.pop(root, None)
+    return Path(best_path)
+
+
+def _smart_find_config(project_root: str) -> Tuple[Optional[Path], str]:
     """查找配置文件，使用和 init_config 完全相同的目录解析逻辑
     
     返回 (配置文件路径, 项目根目录路径)
+
+    查找结果按 (project_root, cwd) 缓存（project_root 为绝对路径时不含 cwd），
+    并记录项目根目录的 mtime：目录内新增/删除候选文件都会改变 mtime，
+    此时重新查找，保证 CONFIG_CANDIDATES 的优先级始终生效。
     """
+    # 绝对路径（含 ~ 开头）的解析结果与 cwd 无关，无需调用 getcwd（cwd 被删除时会抛错）
+    pr = project_root or ""
+    key = (pr, "" if pr.strip() and os.path.isabs(os.path.expanduser(pr)) else os.getcwd())
+    cached = _CFG_LOOKUP_CACHE.get(key)
+    if cached is not None:
+        dir_mtime, config, root = cached
+        try:
+            if os.stat(root).st_mtime_ns == dir_mtime:
+                return config, root
+        except OSError:
+            pass
+
     # 使用和 init_config 完全相同的目录解析方法
     root = _resolve_project_root(project_root)
+
+    # 先记录目录 mtime 再查找：期间若有文件变动，下次校验时 mtime 不一致会重新查找
+    try:
+        dir_mtime = os.stat(root).st_mtime_ns
+    except OSError:
+        _CFG_LOOKUP_CACHE.pop(key, None)
+        return None, root
     
     # 在项目根目录查找配置文件
     config = _find_existing_config(root)
     
+    if key not in _CFG_LOOKUP_CACHE and len(_CFG_LOOKUP_CACHE) >= _CFG_LOOKUP_MAX:
+        # 超出容量时淘汰最早写入的条目
+        del _CFG_LOOKUP_CACHE[next(iter(_CFG_LOOKUP_CACHE))]
+    _CFG_LOOKUP_CACHE[key] = (dir_mtime, config, root)
     return config, root
 
 
-def _load_tokens_from_config(path: Path) -> List[Dict[str, str]]:
-    text = path.read_text(encoding="utf-8")
+def _parse_tokens_file(path: Path) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """解析配置文件，直接返回拆分好的 (auth_headers, auth_params)，空值项已被过滤"""
+    # 直接将字节交给解析器（JSON 按规范为 UTF-8，YAML 由 libyaml 自行识别编码），省去一次解码
+    raw = path.read_bytes() or b"[]"
     if path.suffix.lower() == ".json":
-        data = json.loads(text or "[]")
+        data = _json_loads(raw)
     else:
-        data = yaml.safe_load(text or "[]")
+        yaml, loader, _ = _yaml()
+        data = yaml.load(raw, Loader=loader)
+    auth_headers: Dict[str, str] = {}
+    auth_params: Dict[str, Any] = {}
     if data is None:
-        return []
+        return auth_headers, auth_params
     if not isinstance(data, list):
         raise ValueError("配置文件格式错误：根节点应为列表")
-    tokens: List[Dict[str, str]] = []
+    # 按 type 直接分派到目标字典，同时完成 type 合法性校验
+    targets: Dict[str, Dict[str, Any]] = {"header": auth_headers, "param": auth_params}
     for item in data:
         if not isinstance(item, dict):
             raise ValueError("配置文件项必须为对象，包含 type/key/value")
         t = str(item.get("type", "")).strip().lower()
-        if t not in ("header", "param"):
+        target = targets.get(t)
+        if target is None:
             raise ValueError("配置项 type 仅支持 header 或 param")
         key = str(item.get("key", "")).strip()
-        val = str(item.get("value", "")).strip()
+        raw_val = item.get("value")
+        # YAML 中留空的 `value:` 解析为 None，同样视为空值
+        val = "" if raw_val is None else str(raw_val).strip()
         if not key:
             raise ValueError("配置项缺少 key")
-        tokens.append({"type": t, "key": key, "value": val})
-    return tokens
+        if not val:
+            # 空值项不发送
+            continue
+        target[key] = val
+    return auth_headers, auth_params
+
+
+def _load_tokens_from_config(path: Path) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """返回 (auth_headers, auth_params) 的副本，调用方可自由修改
+
+    文件的设备号/inode/mtime/size 均未变化时直接复用上次的解析结果。
+    """
+    st = os.stat(path)
+    sig = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+    key = str(path)
+    cached = _TOKENS_CACHE.get(key)
+    if cached is None or cached[0] != sig:
+        auth_headers, auth_params = _parse_tokens_file(path)
+        cached = (sig, auth_headers, auth_params)
+        _TOKENS_CACHE[key] = cached
+    return dict(cached[1]), dict(cached[2])
+
+
+def _is_null_str(s: str) -> bool:
+    """判断（已 strip 的）字符串是否表示空值：空串或 null/none/undefined，不区分大小写"""
+    if not s:
+        return True
+    if len(s) > 9 or s[0] not in "nNuU":
+        return False
+    return s.lower() in _NULL_STRS
+
+
+def _try_parse(s: str) -> Any:
+    """尝试将（已 strip 的）字符串按 JSON 解析，无法解析时返回 None
+
+    按首个字符分派：只有可能是容器/字符串的输入才会尝试解析，普通文本与数字/布尔等
+    标量直接返回（标量对 headers/params/body 的处理结果没有影响）。
+    单引号的 Python 风格写法（如 {'a': 1}）会在替换引号后再尝试一次。
+    """
+    c = s[:1]
+    if c and c in "{[\"'":
+        try:
+            return _json_loads(s)
+        except Exception:
+            pass
+        if "'" in s:
+            try:
+                return _json_loads(s.replace("'", '"'))
+            except Exception:
+                pass
+    return None
 
 
 def _as_pairs(obj: Any) -> Optional[List[Tuple[str, Any]]]:
@@ -105,64 +339,244 @@ def _as_dict(obj: Any) -> Optional[Dict[str, Any]]:
     return None
 
 
-def _normalize_headers(base_headers: Dict[str, str], user_headers: Any) -> Dict[str, str]:
-    if user_headers is None:
-        return dict(base_headers)
-    if isinstance(user_headers, str):
-        s = user_headers.strip()
-        if s == "" or s.lower() in ("null", "none", "undefined"):
-            return dict(base_headers)
-        parsed: Any = None
-        try:
-            parsed = json.loads(s)
-        except Exception:
-            try:
-                parsed = ast.literal_eval(s)
-            except Exception:
-                parsed = None
+def _normalize(base: Dict[str, Any], user: Any, *, stringify_values: bool, keep_pairs: bool) -> Any:
+    """将用户传入的 headers/params 合并到鉴权项之上（同键以用户传入为准）
+
+    - user 可为 None、dict、键值对列表，或可解析为上述结构的 JSON 字符串
+    - stringify_values: 是否将值统一转为字符串
+    - keep_pairs: 键值对列表是否保留为有序序列（允许重复键）；否则合并为 dict
+
+    user 为空或无法识别时直接返回 base 本身（不复制），调用方不应修改返回值。
+    """
+    if user is None:
+        return base
+    if isinstance(user, str):
+        s = user.strip()
+        if _is_null_str(s):
+            return base
+        parsed = _try_parse(s)
         if parsed is not None:
-            return _normalize_headers(base_headers, parsed)
-        return dict(base_headers)
-    d = _as_dict(user_headers)
+            return _normalize(base, parsed, stringify_values=stringify_values, keep_pairs=keep_pairs)
+        return base
+    d = _as_dict(user)
     if d is not None:
-        return {**base_headers, **{str(k): str(v) for k, v in d.items()}}
-    p = _as_pairs(user_headers)
+        if stringify_values:
+            d = {k: str(v) for k, v in d.items()}
+        return base | d
+    p = _as_pairs(user)
     if p is not None:
-        merged = dict(base_headers)
-        for k, v in p:
-            merged[str(k)] = str(v)
+        if stringify_values:
+            p = [(k, str(v)) for k, v in p]
+        if keep_pairs:
+            # 顺序为 base 在前，user 覆盖在后（同键后者生效）
+            seq: List[Tuple[str, Any]] = list(base.items())
+            seq.extend(p)
+            return seq
+        merged = dict(base)
+        merged.update(p)
         return merged
-    return dict(base_headers)
+    return base
+
+
+def _normalize_headers(base_headers: Dict[str, str], user_headers: Any) -> Dict[str, str]:
+    return _normalize(base_headers, user_headers, stringify_values=True, keep_pairs=False)
 
 
 def _normalize_params(base_params: Dict[str, Any], user_params: Any) -> Dict[str, Any] | List[Tuple[str, Any]]:
-    if user_params is None:
-        return dict(base_params)
-    if isinstance(user_params, str):
-        s = user_params.strip()
-        if s == "" or s.lower() in ("null", "none", "undefined"):
-            return dict(base_params)
-        parsed: Any = None
+    return _normalize(base_params, user_params, stringify_values=False, keep_pairs=True)
+
+
+def _as_bool(value: Any, default: bool) -> bool:
+    # 兼容上游 AI 以字符串形式传入的布尔值
+    if value is None:
+        return default
+    if isinstance(value, str):
+        v = value.strip().lower()
+        if v in ("false", "0", "no", "off"):
+            return False
+        if v in ("true", "1", "yes", "on"):
+            return True
+        return default
+    return bool(value)
+
+
+def _normalize_method(method: Any) -> str:
+    m = (method if isinstance(method, str) else str(method or "")).strip().upper()
+    return _METHODS.get(m, m)
+
+
+def _get_timeout(seconds: float) -> httpx.Timeout:
+    if seconds == _DEFAULT_TIMEOUT_SECONDS:
+        return _DEFAULT_TIMEOUT
+    timeout = _TIMEOUT_CACHE.get(seconds)
+    if timeout is None:
+        if len(_TIMEOUT_CACHE) >= _TIMEOUT_CACHE_MAX:
+            _TIMEOUT_CACHE.clear()
+        timeout = httpx.Timeout(seconds, connect=seconds, read=seconds, write=seconds)
+        _TIMEOUT_CACHE[seconds] = timeout
+    return timeout
+
+
+def _is_json_content_type(content_type: str) -> bool:
+    # 仅取媒体类型部分（忽略 charset 等参数），匹配 */json 与 */*+json
+    # 最常见的 application/json（可带参数）直接按前缀判断，无需切分与转小写
+    if content_type.startswith("application/json") and content_type[16:17] in ("", ";", " "):
+        return True
+    # 媒体类型不会很长，只检查前 128 个字符
+    media_type = content_type[:128].partition(";")[0].strip().lower()
+    return media_type.endswith(("/json", "+json"))
+
+
+def _decode_response_body(
+    content: bytes, encoding: Optional[str], content_type: str
+) -> Tuple[Optional[Any], Optional[str]]:
+    """返回 (body_json, body_text)，响应体只解码一次
+
+    两者只会有一个非 None。工具返回值会被 FastMCP 整体序列化，
+    延迟解析没有收益，因此这里直接解码，但不同时保留文本与 JSON 两份结果。
+    """
+    if _is_json_content_type(content_type):
         try:
-            parsed = json.loads(s)
+            return _json_loads(content), None
         except Exception:
-            try:
-                parsed = ast.literal_eval(s)
-            except Exception:
-                parsed = None
-        if parsed is not None:
-            return _normalize_params(base_params, parsed)
-        return dict(base_params)
-    d = _as_dict(user_params)
-    if d is not None:
-        return {**base_params, **d}
-    p = _as_pairs(user_params)
-    if p is not None:
-        # 顺序为 base 在前，user 覆盖在后（同键后者生效）
-        seq: List[Tuple[str, Any]] = list(base_params.items())
-        seq.extend(p)
-        return seq
-    return dict(base_params)
+            # 回退：若解析失败（含嵌套过深导致的 RecursionError），返回原始文本
+            pass
+    return None, content.decode(encoding or "utf-8", errors="replace")
+
+
+async def _read_limited(resp: httpx.Response, max_bytes: int) -> Tuple[bytes, bool]:
+    """流式读取响应体，超过 max_bytes 时截断并停止读取；返回 (内容, 是否截断)"""
+    buf = bytearray()
+    async for chunk in resp.aiter_bytes(65536):
+        buf += chunk
+        if len(buf) > max_bytes:
+            del buf[max_bytes:]
+            return bytes(buf), True
+    return bytes(buf), False
+
+
+def _response_headers(resp: httpx.Response, include_all: bool) -> Dict[str, str]:
+    if include_all:
+        # items() 单次遍历合并同名头；dict(resp.headers) 会对每个键再扫描一遍整个头列表
+        return dict(resp.headers.items())
+    return {k: resp.headers[k] for k in _BRIEF_RESPONSE_HEADERS if k in resp.headers}
+
+
+def _load_project_auth(project_root: str) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """定位项目配置文件并返回 (auth_headers, auth_params)"""
+    cfg_path, root = _smart_find_config(project_root)
+    
+    if not cfg_path:
+        raise ValueError(
+            f"未找到配置文件，已在目录 {root} 中查找。\n\n"
+            "请先运行 init_config 工具初始化配置，或手动创建配置文件。\n"
+            "配置文件名称: .mcp_api_request.yml 或 .mcp_api_request.json\n"
+            f"提示: 配置文件应位于 {root} 目录下"
+        )
+
+    return _load_tokens_from_config(cfg_path)
+
+
+def _coerce_max_body_bytes(max_body_bytes: Any) -> Optional[int]:
+    # 未设置或无效时返回 None，表示不限制响应体大小
+    try:
+        limit = int(max_body_bytes)
+    except (TypeError, ValueError):
+        return None
+    return limit if limit > 0 else None
+
+
+def _coerce_timeout(timeout_seconds: Any) -> float:
+    # 更安全的超时构造：连接/读取/写入/总时长
+    try:
+        return float(timeout_seconds)
+    except Exception:
+        return _DEFAULT_TIMEOUT_SECONDS
+
+
+def _prepare_body(body: Any) -> Tuple[Optional[Any], Optional[bytes | str]]:
+    """返回 (send_json, send_content)：dict/list 作为 JSON 发送，其余作为原始内容发送"""
+    if body is None:
+        return None, None
+    if isinstance(body, (dict, list)):
+        return body, None
+    if not isinstance(body, str):
+        return None, str(body)
+    s = body.strip()
+    if _is_null_str(s):
+        return None, None
+    # 尝试解析 JSON 字符串
+    parsed = _try_parse(s)
+    if isinstance(parsed, (dict, list)):
+        return parsed, None
+    if parsed is not None:
+        return None, str(parsed)
+    return None, s
+
+
+async def _send_request(
+    client: httpx.AsyncClient,
+    auth_headers: Dict[str, str],
+    auth_params: Dict[str, Any],
+    timeout: httpx.Timeout,
+    *,
+    method: Any,
+    url: Any,
+    params: Any,
+    headers: Any,
+    body: Any,
+    include_response_headers: bool = True,
+    max_body_bytes: Optional[int] = None,
+) -> Dict[str, Any]:
+    """合并鉴权信息、发送单个请求并整理返回结果"""
+    final_headers: Dict[str, str] = _normalize_headers(auth_headers, headers)
+    final_params = _normalize_params(auth_params, params)
+    send_json, send_content = _prepare_body(body)
+
+    method_upper = _normalize_method(method)
+    if not method_upper:
+        raise ValueError("method 不能为空，例如 GET/POST/PUT/DELETE")
+
+    request_kwargs: Dict[str, Any] = {
+        "params": final_params or None,
+        "headers": final_headers or None,
+        "json": send_json,
+        "content": send_content,
+        "timeout": timeout,
+    }
+    truncated = False
+    if max_body_bytes is None:
+        resp = await client.request(method_upper, url, **request_kwargs)
+        content = resp.content
+    else:
+        # 限制响应体大小时流式读取，超出部分不再下载
+        async with client.stream(method_upper, url, **request_kwargs) as resp:
+            content, truncated = await _read_limited(resp, max_body_bytes)
+
+    content_type = resp.headers.get("content-type", "")
+    body_json, body_text = _decode_response_body(content, resp.encoding, content_type)
+
+    result: Dict[str, Any] = {
+        "request": {
+            "method": method_upper,
+            "url": url,
+            "final_url": str(resp.url),
+            "headers": final_headers,
+            "params": final_params,
+            "body_kind": "json" if send_json is not None else ("content" if send_content is not None else None),
+        },
+        "response": {
+            "status_code": resp.status_code,
+            "reason": getattr(resp, "reason_phrase", None),
+            "elapsed_ms": int(resp.elapsed.total_seconds() * 1000) if resp.elapsed else None,
+            "headers": _response_headers(resp, include_response_headers),
+            "content_type": content_type or None,
+            "json": body_json,
+            "text": body_text,
+            "truncated": truncated,
+        },
+    }
+    return result
 
 
 @server.tool()
@@ -201,15 +615,20 @@ async def init_config(
     ]
 
     if path.suffix.lower() == ".json":
-        content = json.dumps(data, ensure_ascii=False, indent=2)
+        content = _json_dumps(data)
     else:
-        content = yaml.safe_dump(data, allow_unicode=True, sort_keys=False)
+        yaml, _, dumper = _yaml()
+        content = yaml.dump(data, Dumper=dumper, allow_unicode=True, sort_keys=False)
 
     path.write_text(content, encoding="utf-8")
+    # 新配置文件写入后，仅让指向该目录的查找缓存失效，其它项目的缓存保持不变
+    for lookup_key in [k for k, v in _CFG_LOOKUP_CACHE.items() if v[2] == root]:
+        del _CFG_LOOKUP_CACHE[lookup_key]
+    _NEG_DIRS.pop(root, None)
     
     return {
         "path": str(path),
-        "project_root": str(root),
+        "project_root": root,
         "created": True,
         "count": len(data),
         "next_steps": [
@@ -227,7 +646,9 @@ async def api_request(
     params: Any = None,
     headers: Any = None,
     body: Any = None,
-    timeout_seconds: Any = 30.0,
+    timeout_seconds: Any = _DEFAULT_TIMEOUT_SECONDS,
+    include_response_headers: Any = True,
+    max_body_bytes: Any = None,
     **extra_args: Any,
 ) -> Dict[str, Any]:
     """读取配置并请求指定 API，返回基本信息与完整响应。
@@ -239,12 +660,18 @@ async def api_request(
     - headers: 请求头
     - body: 请求体
     - timeout_seconds: 超时时间（秒），默认 30 秒
+    - include_response_headers: 是否返回全部响应头，默认 true；为 false 时仅返回
+      content-type/content-length/server
+    - max_body_bytes: 响应体最大字节数，默认不限制；设置后流式读取，超出部分截断并标记 truncated
     
     功能说明：
     - 从 `.mcp_api_request.yml/.yaml/.json` 读取鉴权配置
     - 自动将 type=header 的 token 加入请求头，将 type=param 的 token 加入查询参数
     - 用户传入的 headers/params 将覆盖同名的鉴权项
     - body 为 dict/list 时作为 JSON 发送；其余类型将作为原始内容发送
+    - 字符串形式的 params/headers/body 按 JSON 解析；单引号写法会替换为双引号后再解析，
+      不支持元组、True/None 等 Python 专有字面量
+    - 需要连续请求多个接口时，请改用 api_request_many 一次性并发发送
     """
     # 验证 project_root 必填
     if not project_root or not isinstance(project_root, str) or not project_root.strip():
@@ -256,7 +683,7 @@ async def api_request(
     if (url is None or str(url).strip() == "") and "url" in extra_args:
         url = extra_args.get("url")
     if timeout_seconds is None or (isinstance(timeout_seconds, str) and timeout_seconds.strip() == ""):
-        timeout_seconds = 30.0
+        timeout_seconds = _DEFAULT_TIMEOUT_SECONDS
     # 处理别名超时键
     if isinstance(timeout_seconds, (int, float)):
         pass
@@ -270,120 +697,93 @@ async def api_request(
         try:
             timeout_seconds = float(alias_to)
         except Exception:
-            timeout_seconds = 30.0
+            timeout_seconds = _DEFAULT_TIMEOUT_SECONDS
+
+    auth_headers, auth_params = _load_project_auth(project_root)
+    client = _get_client()
+    return await _send_request(
+        client,
+        auth_headers,
+        auth_params,
+        _get_timeout(_coerce_timeout(timeout_seconds)),
+        method=method,
+        url=url,
+        params=params,
+        headers=headers,
+        body=body,
+        include_response_headers=_as_bool(include_response_headers, True),
+        max_body_bytes=_coerce_max_body_bytes(max_body_bytes),
+    )
 
-    cfg_path, root = _smart_find_config(project_root)
-    
-    if not cfg_path:
-        raise ValueError(
-            f"未找到配置文件，已在目录 {str(root)} 中查找。\n\n"
-            "请先运行 init_config 工具初始化配置，或手动创建配置文件。\n"
-            "配置文件名称: .mcp_api_request.yml 或 .mcp_api_request.json\n"
-            f"提示: 配置文件应位于 {str(root)} 目录下"
-        )
 
-    tokens = _load_tokens_from_config(cfg_path)
+@server.tool()
+async def api_request_many(
+    project_root: str,
+    requests: Any,
+    timeout_seconds: Any = _DEFAULT_TIMEOUT_SECONDS,
+    include_response_headers: Any = True,
+    max_body_bytes: Any = None,
+) -> Dict[str, Any]:
+    """并发发起多个 API 请求，鉴权配置只读取一次。
 
-    auth_headers: Dict[str, str] = {}
-    auth_params: Dict[str, Any] = {}
-    for item in tokens:
-        value = str(item.get("value", ""))
-        if value == "":
-            # 空值项不发送
-            continue
-        if item["type"] == "header":
-            auth_headers[item["key"]] = value
-        elif item["type"] == "param":
-            auth_params[item["key"]] = value
+    - project_root: 必填项，指定项目根目录的绝对路径
+    - requests: 必填项，请求列表，每项为 {method, url, params, headers, body}，字段含义同 api_request
+    - timeout_seconds: 每个请求的超时时间（秒），默认 30 秒
+    - include_response_headers: 同 api_request，对所有请求生效
+    - max_body_bytes: 同 api_request，对每个响应分别生效
 
-    final_headers: Dict[str, str] = _normalize_headers(auth_headers, headers)
-    final_params = _normalize_params(auth_params, params)
+    功能说明：
+    - 所有请求共享同一份鉴权配置与连接池，通过 asyncio.gather 并发发送
+    - results 与 requests 顺序一致；单个请求失败不影响其它请求，失败项包含 error 字段
+    """
+    if not project_root or not isinstance(project_root, str) or not project_root.strip():
+        raise ValueError("project_root 是必填项，必须提供项目根目录的绝对路径")
 
-    send_json: Optional[Any] = None
-    send_content: Optional[bytes | str] = None
-    if body is not None:
-        if isinstance(body, str):
-            s = body.strip()
-            if s == "" or s.lower() in ("null", "none", "undefined"):
-                pass
-            else:
-                # 尝试解析 JSON/Python 字面量
-                parsed: Any = None
-                try:
-                    parsed = json.loads(s)
-                except Exception:
-                    try:
-                        parsed = ast.literal_eval(s)
-                    except Exception:
-                        parsed = None
-                if isinstance(parsed, (dict, list)):
-                    send_json = parsed
-                elif parsed is not None:
-                    send_content = str(parsed)
-                else:
-                    send_content = s
-        else:
-            if isinstance(body, (dict, list)):
-                send_json = body
-            else:
-                send_content = str(body)
-        if isinstance(body, (dict, list)):
-            send_json = body
-        else:
-            send_content = str(body)
+    if isinstance(requests, str):
+        requests = _try_parse(requests.strip())
+    if not isinstance(requests, list) or not requests:
+        raise ValueError("requests 必须为非空列表，每项包含 method/url 等字段")
 
-    method_upper = str(method or "").strip().upper()
-    if not method_upper:
-        raise ValueError("method 不能为空，例如 GET/POST/PUT/DELETE")
+    auth_headers, auth_params = _load_project_auth(project_root)
+    client = _get_client()
+    timeout = _get_timeout(_coerce_timeout(timeout_seconds))
+    full_headers = _as_bool(include_response_headers, True)
+    body_limit = _coerce_max_body_bytes(max_body_bytes)
 
-    # 更安全的超时构造：连接/读取/写入/总时长
-    try:
-        to = float(timeout_seconds)
-    except Exception:
-        to = 30.0
-    timeout = httpx.Timeout(to, connect=to, read=to, write=to)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        resp = await client.request(
-            method_upper,
-            url,
-            params=final_params or None,
-            headers=final_headers or None,
-            json=send_json,
-            content=send_content,
+    async def _send_item(item: Any) -> Dict[str, Any]:
+        if not isinstance(item, dict):
+            raise ValueError("requests 中的每一项必须为对象")
+        return await _send_request(
+            client,
+            auth_headers,
+            auth_params,
+            timeout,
+            method=item.get("method"),
+            url=item.get("url"),
+            params=item.get("params"),
+            headers=item.get("headers"),
+            body=item.get("body"),
+            include_response_headers=full_headers,
+            max_body_bytes=body_limit,
         )
 
-    content_type = resp.headers.get("content-type", "")
-    body_text: Optional[str] = None
-    body_json: Optional[Any] = None
-    try:
-        if "json" in content_type.lower():
-            body_json = resp.json()
+    outcomes = await asyncio.gather(*(_send_item(item) for item in requests), return_exceptions=True)
+
+    results: List[Dict[str, Any]] = []
+    for item, outcome in zip(requests, outcomes):
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome
+            results.append({
+                "request": {
+                    "method": item.get("method") if isinstance(item, dict) else None,
+                    "url": item.get("url") if isinstance(item, dict) else None,
+                },
+                "error": f"{type(outcome).__name__}: {outcome}",
+            })
         else:
-            body_text = resp.text
-    except Exception:
-        # 回退：若解析失败，返回原始文本
-        body_text = resp.text
-
-    result: Dict[str, Any] = {
-        "request": {
-            "method": method_upper,
-            "url": url,
-            "final_url": str(resp.url),
-            "headers": final_headers,
-            "params": final_params,
-            "body_kind": "json" if send_json is not None else ("content" if send_content is not None else None),
-        },
-        "response": {
-            "status_code": resp.status_code,
-            "reason": getattr(resp, "reason_phrase", None),
-            "elapsed_ms": int(resp.elapsed.total_seconds() * 1000) if resp.elapsed else None,
-            "headers": dict(resp.headers),
-            "content_type": content_type or None,
-            "json": body_json,
-            "text": body_text,
-        },
-    }
-    return result
+            results.append(outcome)
+    return {"count": len(results), "results": results}
 
 
 def main() -> None: